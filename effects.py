@@ -263,8 +263,9 @@ class CharacterCorruptionEffect(BaseEffect):
  
     def _corrupt_text(self, text):
         if not text: return ""
+        num_to_corrupt = int(len(text) * self.corruption_intensity)
+        if num_to_corrupt <= 0: return text # Low intensity or short line: nothing to corrupt this tick
         text_list = list(text)
-        num_to_corrupt = int(len(text_list) * self.corruption_intensity)
         indices_to_corrupt = random.sample(range(len(text_list)), k=min(num_to_corrupt, len(text_list)))
         
         for i in indices_to_corrupt:
@@ -17,6 +17,27 @@ ROLE_WHITE_HAT = "WHITE_HAT"
 ROLE_GREY_HAT = "GREY_HAT"
 ROLE_BLACK_HAT = "BLACK_HAT"
 
+# --- Role Attributes ---
+# Starting attributes for each role, resolved with a single lookup when a role is chosen.
+ROLE_ATTRIBUTES = {
+    ROLE_WHITE_HAT: {
+        'background': "Former Aether Corp Security Specialist",
+        'motivation': "Redemption and Protection",
+        'initial_skill_focus': "System Integrity",
+    },
+    ROLE_GREY_HAT: {
+        'background': "Investigative Journalist / Info Broker",
+        'motivation': "Truth and Balance",
+        'initial_skill_focus': "Information Gathering",
+    },
+    ROLE_BLACK_HAT: {
+        'background': "Terminally Ill Programmer seeking Digital Transcendence",
+        'motivation': "Power and Evolution",
+        'initial_skill_focus': "Exploitation",
+    },
+    # Add more roles/attributes as needed
+}
+
 class GameStateManager:
     def __init__(self, initial_state=STATE_DISCLAIMER):
         self.current_state = initial_state
@@ -54,20 +75,8 @@ class GameStateManager:
 
     def initialize_player_attributes(self):
         """Initializes player attributes based on the current role."""
-        self.player_attributes = {} # Reset attributes
-        if self.player_role == ROLE_WHITE_HAT:
-            self.player_attributes['background'] = "Former Aether Corp Security Specialist"
-            self.player_attributes['motivation'] = "Redemption and Protection"
-            self.player_attributes['initial_skill_focus'] = "System Integrity"
-        elif self.player_role == ROLE_GREY_HAT:
-            self.player_attributes['background'] = "Investigative Journalist / Info Broker"
-            self.player_attributes['motivation'] = "Truth and Balance"
-            self.player_attributes['initial_skill_focus'] = "Information Gathering"
-        elif self.player_role == ROLE_BLACK_HAT:
-            self.player_attributes['background'] = "Terminally Ill Programmer seeking Digital Transcendence"
-            self.player_attributes['motivation'] = "Power and Evolution"
-            self.player_attributes['initial_skill_focus'] = "Exploitation"
-        # Add more attributes as needed
+        # Copy so per-session changes never leak back into the shared role table
+        self.player_attributes = dict(ROLE_ATTRIBUTES.get(self.player_role, {}))
 
     def get_player_role(self):
         """Returns the player's chosen role."""
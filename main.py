@@ -76,6 +76,7 @@ def load_monospace_font(size):
 disclaimer_mono_font_large = load_monospace_font(DISCLAIMER_FONT_SIZE_LARGE)
 disclaimer_mono_font_medium = load_monospace_font(DISCLAIMER_FONT_SIZE_MEDIUM)
 disclaimer_mono_font_small = load_monospace_font(DISCLAIMER_FONT_SIZE_SMALL)
+minigame_placeholder_font = pygame.font.Font(None, 28) # Loaded once; the minigame screen redraws every frame
 
 
 # --- Game State ---
@@ -160,17 +161,67 @@ skull_frame_lines_open = [line.rstrip() for line in skull_frame_lines_open_raw]
 # Pad the shorter frame to match the length of the longer one
 max_lines = max(len(skull_frame_lines_closed), len(skull_frame_lines_open))
 
-while len(skull_frame_lines_closed) < max_lines:
-    skull_frame_lines_closed.append("")
-while len(skull_frame_lines_open) < max_lines:
-    skull_frame_lines_open.append("")
+skull_frame_lines_closed.extend([""] * (max_lines - len(skull_frame_lines_closed)))
+skull_frame_lines_open.extend([""] * (max_lines - len(skull_frame_lines_open)))
  
 skull_frames = [skull_frame_lines_closed, skull_frame_lines_open]
+
+# The skull art and its font never change, so measure each frame once here
+# rather than calling font.size() for every line on every rendered frame.
+skull_frame_max_widths = [
+    max((disclaimer_mono_font_medium.size(line)[0] for line in frame_lines), default=0)
+    for frame_lines in skull_frames
+]
+# First line of each frame: (content without leading spaces, visual width of those spaces)
+skull_frame_first_line_layouts = []
+for frame_lines in skull_frames:
+    first_line = frame_lines[0] if frame_lines else ""
+    first_line_content = first_line.lstrip()
+    first_line_leading = first_line[:len(first_line) - len(first_line_content)]
+    first_line_leading_width = disclaimer_mono_font_medium.size(first_line_leading)[0] if first_line_leading else 0
+    skull_frame_first_line_layouts.append((first_line_content, first_line_leading_width))
+
 current_skull_frame_index = 0 # Initialize skull animation index
 skull_animation_timer = 0
 SKULL_ANIMATION_INTERVAL = 350 # milliseconds
-GLITCH_CHARS = ['*', '#', '$', '%', '&', '?', '§', '!', '~', '@', '^']
+GLITCH_CHARS = ('*', '#', '$', '%', '&', '?', '§', '!', '~', '@', '^')
 CHARACTER_CORRUPTION_CHANCE = 0.03 # 3% chance per character
+# Disclaimer body text, shown one line per row with per-character glitching
+DISCLAIMER_MESSAGES = (
+    "This game is a work of fiction and intended for mature audiences.",
+    "It explores themes of horror and hacking.",
+    " ",
+    "The activities depicted, if performed in real life, can have serious",
+    "legal, ethical, and personal consequences.",
+    " ",
+    "This simulation does not endorse or encourage any illegal or unethical behavior.",
+    "Always act responsibly and ethically online and offline.",
+    " ",
+    "Player discretion is strongly advised.",
+)
+
+# --- Role Selection ---
+# Key -> role, and role -> (display name, username, hostname, intro lines), so a
+# role choice is resolved with table lookups instead of per-keypress if/elif chains.
+ROLE_SELECTION_KEYS = {
+    pygame.K_1: ROLE_WHITE_HAT, pygame.K_KP_1: ROLE_WHITE_HAT,
+    pygame.K_2: ROLE_GREY_HAT, pygame.K_KP_2: ROLE_GREY_HAT,
+    pygame.K_3: ROLE_BLACK_HAT, pygame.K_KP_3: ROLE_BLACK_HAT,
+}
+ROLE_SELECTION_PROFILES = {
+    ROLE_WHITE_HAT: ("White Hat", "guardian", "aegis-01", (
+        ("System protocols updated. Defensive measures online.", 'success'),
+        ("Your mission: Protect the innocent. Uphold the light.", 'highlight'),
+    )),
+    ROLE_GREY_HAT: ("Grey Hat", "shadow_walker", "nexus-7", (
+        ("Network access rerouted. Anonymity cloak engaged.", 'highlight'),
+        ("The lines blur. Your path is your own to forge.", 'default_fg'),
+    )),
+    ROLE_BLACK_HAT: ("Black Hat", "void_reaver", "hades-net", (
+        ("Firewalls bypassed. Root access granted. The system is yours.", 'error'),
+        ("Embrace the chaos. Exploit the vulnerabilities.", 'error'),
+    )),
+}
 
 # --- Main Game Loop ---
 running = True
@@ -223,40 +274,19 @@ while running:
                     running = False
         elif game_state_manager.is_state(STATE_ROLE_SELECTION):
             if event.type == pygame.KEYDOWN:
-                role_chosen = None
-                role_name_str = ""
-                if event.key == pygame.K_1 or event.key == pygame.K_KP_1:
-                    role_chosen = ROLE_WHITE_HAT
-                    role_name_str = "White Hat"
-                elif event.key == pygame.K_2 or event.key == pygame.K_KP_2:
-                    role_chosen = ROLE_GREY_HAT
-                    role_name_str = "Grey Hat"
-                elif event.key == pygame.K_3 or event.key == pygame.K_KP_3:
-                    role_chosen = ROLE_BLACK_HAT
-                    role_name_str = "Black Hat"
-                elif event.key == pygame.K_ESCAPE:
+                role_chosen = ROLE_SELECTION_KEYS.get(event.key)
+                if event.key == pygame.K_ESCAPE:
                     running = False
 
                 if role_chosen:
+                    role_name_str, username, hostname, intro_lines = ROLE_SELECTION_PROFILES[role_chosen]
                     game_state_manager.set_player_role(role_chosen)
                     terminal.clear_buffer()
                     terminal.add_line(f"Operational Alignment: {role_name_str} confirmed.", style_key='success')
-
-                    if role_chosen == ROLE_WHITE_HAT:
-                        terminal.set_username("guardian")
-                        terminal.set_hostname("aegis-01")
-                        terminal.add_line("System protocols updated. Defensive measures online.", style_key='success')
-                        terminal.add_line("Your mission: Protect the innocent. Uphold the light.", style_key='highlight')
-                    elif role_chosen == ROLE_GREY_HAT:
-                        terminal.set_username("shadow_walker")
-                        terminal.set_hostname("nexus-7")
-                        terminal.add_line("Network access rerouted. Anonymity cloak engaged.", style_key='highlight')
-                        terminal.add_line("The lines blur. Your path is your own to forge.", style_key='default_fg')
-                    elif role_chosen == ROLE_BLACK_HAT:
-                        terminal.set_username("void_reaver")
-                        terminal.set_hostname("hades-net")
-                        terminal.add_line("Firewalls bypassed. Root access granted. The system is yours.", style_key='error')
-                        terminal.add_line("Embrace the chaos. Exploit the vulnerabilities.", style_key='error')
+                    terminal.set_username(username)
+                    terminal.set_hostname(hostname)
+                    for intro_text, intro_style in intro_lines:
+                        terminal.add_line(intro_text, style_key=intro_style)
                     
                     # Display background info
                     background = game_state_manager.get_player_attribute('background')
@@ -434,25 +464,15 @@ while running:
         skull_color = (0, 200, 50) # Glitchy green
         current_skull_art_lines = skull_frames[current_skull_frame_index]
         
-        # Calculate max width of skull lines for centering
-        max_skull_line_width = 0
-        if current_skull_art_lines:
-             max_skull_line_width = max(disclaimer_mono_font_medium.size(line)[0] for line in current_skull_art_lines)
+        # Skull widths are measured once at startup (see skull_frame_max_widths)
+        max_skull_line_width = skull_frame_max_widths[current_skull_frame_index]
         
         skull_x_start = WINDOW_WIDTH // 2 - max_skull_line_width // 2
         
         for i, line in enumerate(current_skull_art_lines):
             line_y_pos = skull_y_start + i * disclaimer_mono_font_medium.get_linesize()
             if i == 0: # Special handling for the first line
-                content_part = line.lstrip()
-                # Get the original leading whitespace string
-                num_leading_spaces = len(line) - len(content_part)
-                leading_spaces_original_str = line[:num_leading_spaces]
-                
-                # Calculate the visual width of these leading spaces
-                leading_spaces_width = 0
-                if leading_spaces_original_str: # Ensure there are spaces to measure
-                    leading_spaces_width = disclaimer_mono_font_medium.size(leading_spaces_original_str)[0]
+                content_part, leading_spaces_width = skull_frame_first_line_layouts[current_skull_frame_index]
                 
                 # Render the content part, visually offset by its original leading spaces, from skull_x_start
                 render_x_position = skull_x_start + leading_spaces_width
@@ -490,20 +510,8 @@ while running:
 
 
         # --- Render Disclaimer Messages with Character Corruption ---
-        messages = [
-            "This game is a work of fiction and intended for mature audiences.",
-            "It explores themes of horror and hacking.",
-            " ",
-            "The activities depicted, if performed in real life, can have serious",
-            "legal, ethical, and personal consequences.",
-            " ",
-            "This simulation does not endorse or encourage any illegal or unethical behavior.",
-            "Always act responsibly and ethically online and offline.",
-            " ",
-            "Player discretion is strongly advised."
-        ]
         original_message_color = (200, 200, 200)
-        for msg_line in messages:
+        for msg_line in DISCLAIMER_MESSAGES:
             msg_total_width = disclaimer_mono_font_small.size(msg_line)[0]
             current_msg_char_x = WINDOW_WIDTH // 2 - msg_total_width // 2
             
@@ -560,7 +568,7 @@ while running:
         terminal.render(screen, effect_manager)
     elif game_state_manager.is_state(STATE_MINIGAME):
         # Placeholder for minigame rendering
-        render_text(screen, "MINIGAME ACTIVE", (10,10), fg_color=(0,255,255), font=pygame.font.Font(None, 28))
+        render_text(screen, "MINIGAME ACTIVE", (10,10), fg_color=(0,255,255), font=minigame_placeholder_font)
     elif game_state_manager.is_state(STATE_PUZZLE_ACTIVE):
         # Puzzle content is displayed via the terminal buffer
         terminal.render(screen, effect_manager)
@@ -1,4 +1,6 @@
 import random
+import string
+from functools import lru_cache
 from typing import List, Any, Dict, Tuple
 
 class Puzzle:
@@ -63,11 +65,19 @@ class SequenceCompletionPuzzle(AlgorithmPuzzle):
                  difficulty: int = 1):
         super().__init__(puzzle_id, name, description, difficulty)
         self.sequence_prompt = sequence_prompt # e.g., [2, 4, "6", 8, "?"] or "A B C ?"
-        self.solution = solution # e.g., [10] or ["D"]
+        self.solution = list(solution) # e.g., [10] or ["D"]; compared against the parsed input list
+        # The prompt never changes after construction, so render it once
+        self._prompt_str = " ".join(map(str, sequence_prompt))
+        # Pick the parser for player input once, based on the solution's element type
+        if solution and isinstance(solution[0], int):
+            self._parse_value = int
+        elif solution and isinstance(solution[0], float):
+            self._parse_value = float
+        else: # Assume string
+            self._parse_value = str
 
     def get_display_text(self) -> str:
-        prompt_str = " ".join(map(str, self.sequence_prompt))
-        return f"{self.name}\n\n{self.description}\n\nSequence: {prompt_str}"
+        return f"{self.name}\n\n{self.description}\n\nSequence: {self._prompt_str}"
 
     def attempt_solution(self, player_input: str) -> Tuple[bool, str]:
         self.attempts += 1
@@ -75,12 +85,8 @@ class SequenceCompletionPuzzle(AlgorithmPuzzle):
         try:
             # Convert player input to the same type as solution elements for comparison
             # This is a simple approach; more robust parsing might be needed.
-            if isinstance(self.solution[0], int):
-                attempted_values = [int(x.strip()) for x in player_input.split(',')]
-            elif isinstance(self.solution[0], float):
-                attempted_values = [float(x.strip()) for x in player_input.split(',')]
-            else: # Assume string
-                attempted_values = [x.strip() for x in player_input.split(',')]
+            parse_value = self._parse_value
+            attempted_values = [parse_value(x.strip()) for x in player_input.split(',')]
 
             if attempted_values == self.solution:
                 self.solved = True
@@ -100,6 +106,19 @@ class CryptographicPuzzle(Puzzle):
         super().__init__(puzzle_id, name, description, difficulty)
         self.category = "Cryptographic"
 
+@lru_cache(maxsize=None)
+def _caesar_decrypt_table(shift: int) -> Dict[int, int]:
+    """
+    Builds (once per shift) a str.translate table that undoes a Caesar shift,
+    so decryption runs as a single C-level pass instead of a per-character loop.
+    """
+    shift %= 26
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    return str.maketrans(
+        lower + upper,
+        lower[-shift:] + lower[:-shift] + upper[-shift:] + upper[:-shift]
+    )
+
 class CaesarCipherPuzzle(CryptographicPuzzle):
     """
     A puzzle where the player must decrypt a Caesar cipher.
@@ -110,30 +129,17 @@ class CaesarCipherPuzzle(CryptographicPuzzle):
         self.ciphertext = ciphertext
         self.shift = shift
         self.plaintext = self._decrypt(ciphertext, shift)
+        self._plaintext_lower = self.plaintext.lower() # Compared against every attempt
 
     def _decrypt(self, text: str, shift: int) -> str:
-        result = []
-        for char in text:
-            if 'a' <= char <= 'z':
-                s = ord(char) - shift
-                if s < ord('a'):
-                    s += 26
-                result.append(chr(s))
-            elif 'A' <= char <= 'Z':
-                s = ord(char) - shift
-                if s < ord('A'):
-                    s += 26
-                result.append(chr(s))
-            else:
-                result.append(char)
-        return "".join(result)
+        return text.translate(_caesar_decrypt_table(shift))
 
     def get_display_text(self) -> str:
         return f"{self.name}\n\n{self.description}\n\nCiphertext: {self.ciphertext}"
 
     def attempt_solution(self, player_input: str) -> Tuple[bool, str]:
         self.attempts += 1
-        if player_input.strip().lower() == self.plaintext.lower():
+        if player_input.strip().lower() == self._plaintext_lower:
             self.solved = True
             return True, self.on_solve()
         else:
@@ -145,6 +151,29 @@ class CaesarCipherPuzzle(CryptographicPuzzle):
         return "Hint: It's a type of substitution cipher."
 
 
+# --- Default Puzzles ---
+# (class, constructor kwargs) for the puzzles every PuzzleManager starts with.
+# Sequence data is stored as tuples so the shared table can never be mutated through a puzzle.
+_DEFAULT_PUZZLE_SPECS = (
+    (SequenceCompletionPuzzle, dict(
+        puzzle_id="SEQ001",
+        name="Simple Number Sequence",
+        description="Complete the following number sequence.",
+        sequence_prompt=(2, 4, 6, 8, "?"),
+        solution=(10,),
+        difficulty=1
+    )),
+    (CaesarCipherPuzzle, dict(
+        puzzle_id="CRYP001",
+        name="Encrypted Message",
+        description="Decrypt the following message. It seems to be shifted.",
+        ciphertext="Khoor Zruog", # Hello World shifted by 3
+        shift=3,
+        difficulty=1
+    )),
+)
+
+
 class PuzzleManager:
     """
     Manages the puzzles in the game.
@@ -156,26 +185,8 @@ class PuzzleManager:
 
     def _load_default_puzzles(self):
         """Loads a set of predefined puzzles for testing/initial gameplay."""
-        seq_puzzle = SequenceCompletionPuzzle(
-            puzzle_id="SEQ001",
-            name="Simple Number Sequence",
-            description="Complete the following number sequence.",
-            sequence_prompt=[2, 4, 6, 8, "?"],
-            solution=[10],
-            difficulty=1
-        )
-        self.load_puzzle(seq_puzzle)
-
-        caesar_puzzle = CaesarCipherPuzzle(
-            puzzle_id="CRYP001",
-            name="Encrypted Message",
-            description="Decrypt the following message. It seems to be shifted.",
-            ciphertext="Khoor Zruog", # Hello World shifted by 3
-            shift=3,
-            difficulty=1
-        )
-        self.load_puzzle(caesar_puzzle)
-
+        for puzzle_cls, puzzle_kwargs in _DEFAULT_PUZZLE_SPECS:
+            self.load_puzzle(puzzle_cls(**puzzle_kwargs))
 
     def load_puzzle(self, puzzle: Puzzle):
         """Loads a single puzzle into the manager."""
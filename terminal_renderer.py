@@ -1,4 +1,5 @@
 import pygame
+from functools import lru_cache
 from effects import get_theme_color, get_current_theme, set_theme as set_global_theme, TextOverlayEffect, TextJiggleEffect, COLOR_WHITE # Import effect classes
 from file_system_handler import FileSystemHandler # Import the new handler
 
@@ -7,11 +8,18 @@ DEFAULT_FONT_SIZE = 18
 LINE_SPACING = 0 
 MARGIN_X = 10
 MARGIN_Y = 10
+RENDERED_TEXT_CACHE_SIZE = 512 # Rasterized text surfaces kept for reuse across frames
 
 # Use a sentinel for "not provided" to distinguish from explicitly passing None
 _NOT_PROVIDED = object()
 
 # --- Text Rendering Function ---
+@lru_cache(maxsize=RENDERED_TEXT_CACHE_SIZE)
+def _render_text_surface(font, text, antialias, fg_color, bg_color, bold):
+    """Rasterizes text once per (font, text, style) and reuses the surface on later frames.
+    `bold` is only part of the cache key; the caller has already applied it to the font."""
+    return font.render(text, antialias, fg_color, bg_color)
+
 def render_text_line(surface, text, position, fg_color, font, bg_color=None, bold=False, antialias=True):
     current_font = font
     original_bold_state = current_font.get_bold()
@@ -19,7 +27,11 @@ def render_text_line(surface, text, position, fg_color, font, bg_color=None, bol
         current_font.set_bold(True)
     
     try:
-        text_surface = current_font.render(text, antialias, fg_color, bg_color)
+        try:
+            text_surface = _render_text_surface(current_font, text, antialias, fg_color, bg_color, bold or original_bold_state)
+        except TypeError:
+            # Unhashable arguments (e.g. pygame.Color or list colors) can't be cached; render directly
+            text_surface = current_font.render(text, antialias, fg_color, bg_color)
         surface.blit(text_surface, position)
     except Exception as e:
         print(f"Error rendering text '{text}' with fg={fg_color}, bg={bg_color}, bold={bold}: {e}")
@@ -272,9 +284,9 @@ class Terminal:
         start_index = self.scroll_offset
         end_index = min(len(self.buffer), self.scroll_offset + self.max_lines_visible)
         current_y = self.MARGIN_Y
-        active_jiggle_effect = None
-        if effect_manager and effect_manager.effect_queue and isinstance(effect_manager.effect_queue[0], TextJiggleEffect):
-            active_jiggle_effect = effect_manager.effect_queue[0]
+        # Resolve the head of the effect queue once; it's None on the common no-effect frame
+        head_effect = effect_manager.effect_queue[0] if effect_manager and effect_manager.effect_queue else None
+        active_jiggle_effect = head_effect if isinstance(head_effect, TextJiggleEffect) else None
 
         for i in range(start_index, end_index):
             text, fg_color_stored, bg_color, is_bold = self.buffer[i]
@@ -356,12 +368,10 @@ class Terminal:
                     render_text_line(surface, cursor_char_to_render, (cursor_x, cursor_y),
                                      char_on_cursor_fg_color, self.font, bold=False) # bold is already a kwarg here
 
-        if effect_manager:
-            if effect_manager.effect_queue and isinstance(effect_manager.effect_queue[0], TextOverlayEffect):
-                active_overlay_effect = effect_manager.effect_queue[0]
-                overlay_elements = active_overlay_effect.get_overlay_elements()
-                for char, x, y, color in overlay_elements:
-                    render_text_line(surface, char, (x,y), fg_color=color, font=self.font)
+        if isinstance(head_effect, TextOverlayEffect):
+            overlay_elements = head_effect.get_overlay_elements()
+            for char, x, y, color in overlay_elements:
+                render_text_line(surface, char, (x,y), fg_color=color, font=self.font)
 
     def apply_theme_colors(self):
         old_default_fg = self.font_color if hasattr(self, 'font_color') else None
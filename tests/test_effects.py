@@ -506,6 +506,15 @@ def test_character_corruption_effect_corrupt_text_all_spaces(mocker):
     mock_sample.assert_called_once()
     mock_choice.assert_not_called() # random.choice should not be called if all are spaces
 
+def test_character_corruption_effect_corrupt_text_below_one_char_skips_sampling(mocker):
+    effect = CharacterCorruptionEffect(0, 100, corruption_intensity=0.1)
+    mock_sample = mocker.patch.object(effects_module.random, 'sample')
+    mock_choice = mocker.patch.object(effects_module.random, 'choice')
+
+    assert effect._corrupt_text("Hi there") == "Hi there" # len 8 * 0.1 -> 0 chars
+    mock_sample.assert_not_called()
+    mock_choice.assert_not_called()
+
 def test_character_corruption_effect_update_progress_and_re_corrupt(mock_terminal_ref, corruption_effect_params, mocker):
     mock_terminal_ref.buffer = [("Original Text", "fg", "bg", False)]
     effect = CharacterCorruptionEffect(**corruption_effect_params) # rate = 50ms
@@ -12,7 +12,8 @@ from game_state import (
     ROLE_NONE,
     ROLE_WHITE_HAT,
     ROLE_GREY_HAT,
-    ROLE_BLACK_HAT
+    ROLE_BLACK_HAT,
+    ROLE_ATTRIBUTES
 )
 
 # Test the constants themselves
@@ -160,6 +161,17 @@ def test_initialize_player_attributes(manager):
     assert manager.player_attributes == last_valid_role_attributes # Attributes should not change
 
 
+def test_initialize_player_attributes_returns_independent_copy(manager):
+    """Mutating a session's attributes must not alter the shared role table."""
+    manager.set_player_role(ROLE_WHITE_HAT)
+    manager.player_attributes['background'] = "Changed"
+    assert ROLE_ATTRIBUTES[ROLE_WHITE_HAT]['background'] == "Former Aether Corp Security Specialist"
+
+    other_manager = GameStateManager()
+    other_manager.set_player_role(ROLE_WHITE_HAT)
+    assert other_manager.get_player_attribute('background') == "Former Aether Corp Security Specialist"
+
+
 def test_state_transitions_and_role_setting(manager):
     # Initial
     assert manager.is_state(STATE_DISCLAIMER)
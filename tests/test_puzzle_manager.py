@@ -102,6 +102,22 @@ def test_sequence_puzzle_attempt_solution_incorrect_multi_number_partial(sequenc
     assert "incorrect" in feedback.lower()
 
 
+def test_sequence_puzzle_attempt_solution_float_values():
+    puzzle = SequenceCompletionPuzzle(
+        puzzle_id="SEQ_FLOAT",
+        name="Halving Sequence",
+        description="Complete the halving sequence.",
+        sequence_prompt=[4.0, 2.0, 1.0, "?"],
+        solution=[0.5],
+        difficulty=1
+    )
+    solved, _ = puzzle.attempt_solution(" 0.50 ")
+    assert solved
+    puzzle.solved = False
+    solved, feedback = puzzle.attempt_solution("half")
+    assert not solved
+    assert "invalid input format" in feedback.lower()
+
 def test_sequence_puzzle_on_solve(sequence_puzzle_numbers):
     sequence_puzzle_numbers.solved = True # Manually set for testing on_solve directly if needed
     feedback = sequence_puzzle_numbers.on_solve()
@@ -221,6 +237,11 @@ def test_caesar_cipher_puzzle_decrypt():
     assert CaesarCipherPuzzle._decrypt(None, "Qeb Nrfzh Yoltk Clu...", 23) == "The Quick Brown Fox..."
     # Test with zero shift
     assert CaesarCipherPuzzle._decrypt(None, "NoChange", 0) == "NoChange"
+    # Shifts outside 0-25 wrap to the equivalent shift
+    assert CaesarCipherPuzzle._decrypt(None, "Khoor Zruog", 29) == "Hello World"
+    assert CaesarCipherPuzzle._decrypt(None, "Ebiil Tloia", -3) == "Hello World"
+    # Non-ASCII letters are left untouched
+    assert CaesarCipherPuzzle._decrypt(None, "Khoor Wörld", 3) == "Hello Töoia"
 
 
 # --- Test Fixtures for PuzzleManager ---
@@ -259,6 +280,20 @@ def test_puzzle_manager_load_default_puzzles():
     assert isinstance(manager.puzzles["CRYP001"], CaesarCipherPuzzle)
 
 
+def test_puzzle_manager_default_puzzles_are_independent_and_solvable():
+    first = PuzzleManager()
+    second = PuzzleManager()
+    assert first.puzzles["SEQ001"] is not second.puzzles["SEQ001"]
+
+    first.start_puzzle("SEQ001")
+    solved, _ = first.attempt_active_puzzle("10")
+    assert solved
+    assert not second.puzzles["SEQ001"].solved
+
+    second.start_puzzle("CRYP001")
+    solved, _ = second.attempt_active_puzzle("hello world")
+    assert solved
+
 def test_puzzle_manager_load_puzzle(empty_puzzle_manager, sequence_puzzle_strings):
     assert not empty_puzzle_manager.get_puzzle("SEQ_STR")
     empty_puzzle_manager.load_puzzle(sequence_puzzle_strings)
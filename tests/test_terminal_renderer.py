@@ -222,6 +222,32 @@ def test_render_text_line_calls_font_render(mock_pygame_font):
         assert mock_font_instance.set_bold.call_args_list[-1] == call(False)
 
 
+def test_render_text_line_reuses_cached_surface(mock_pygame_font):
+    mock_surface = MagicMock(spec=pygame.Surface)
+    mock_font_instance = mock_pygame_font["instance"]
+
+    render_text_line(mock_surface, "cached", (0, 0), COLOR_GREEN_BRIGHT, mock_font_instance)
+    render_text_line(mock_surface, "cached", (0, 20), COLOR_GREEN_BRIGHT, mock_font_instance)
+
+    mock_font_instance.render.assert_called_once_with("cached", True, COLOR_GREEN_BRIGHT, None)
+    assert mock_surface.blit.call_count == 2
+    # A different color is a different surface and must be rasterized again
+    render_text_line(mock_surface, "cached", (0, 40), COLOR_BLACK, mock_font_instance)
+    assert mock_font_instance.render.call_count == 2
+
+def test_render_text_line_unhashable_color_renders_directly(mock_pygame_font):
+    mock_surface = MagicMock(spec=pygame.Surface)
+    mock_font_instance = mock_pygame_font["instance"]
+    list_color = [0, 255, 0]
+
+    render_text_line(mock_surface, "uncached", (0, 0), list_color, mock_font_instance)
+    render_text_line(mock_surface, "uncached", (0, 0), list_color, mock_font_instance)
+
+    assert mock_font_instance.render.call_count == 2
+    mock_font_instance.render.assert_called_with("uncached", True, list_color, None)
+    assert mock_surface.blit.call_count == 2
+
+
 # More tests to come for:
 # - resize
 # - _wrap_text